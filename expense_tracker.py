@@ -1,51 +1,109 @@
 
 from __future__ import annotations
-from dataclasses import dataclass
-from datetime import datetime, date
-from decimal import Decimal, InvalidOperation
-from typing import List, Optional, Dict, Tuple
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal, DecimalException, InvalidOperation, ROUND_HALF_UP
+from functools import lru_cache
+from typing import Callable, Iterable, Optional, Dict, Tuple, Union
+from operator import itemgetter
 import csv
 import json
 import os
+import re
+import sys
 
 RUPEE = '\u20B9'
-
-@dataclass
+EXPENSE_FIELDS: Tuple[str, ...] = ("date", "category", "amount", "description")
+# Amounts must stay below 10**15 rupees so paise fit in 64 bits and quantizing stays exact.
+_MAX_AMOUNT_DIGITS: int = 15
+_PAISA: Decimal = Decimal('0.01')
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.ASCII)
+
+def _parse_iso_date(value: str) -> date:
+    """
+    Parses a YYYY-MM-DD string with a precompiled pattern, which is much cheaper than strptime.
+
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date.
+    """
+    m: Optional[re.Match[str]] = _DATE_RE.fullmatch(value.strip())
+    if m is None:
+        raise ValueError(f"Invalid date: {value!r}")
+    return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+def _to_paise(value: Union[str, Decimal]) -> int:
+    """
+    Converts a rupee amount to integer paise, rounding half up to the nearest paisa.
+
+    Raises:
+        InvalidOperation: If the value is not a finite number or is out of range.
+    """
+    amt: Decimal = value if isinstance(value, Decimal) else Decimal(value.strip())
+    if not amt.is_finite():
+        raise InvalidOperation("Amount must be a finite number")
+    if amt and amt.adjusted() >= _MAX_AMOUNT_DIGITS:
+        raise InvalidOperation("Amount is out of range")
+    return int(amt.quantize(_PAISA, rounding=ROUND_HALF_UP).scaleb(2))
+
+def _from_paise(paise: int) -> Decimal:
+    """Converts integer paise back to a rupee Decimal with two decimal places."""
+    return Decimal(paise).scaleb(-2)
+
+@lru_cache(maxsize=4096)
+def _fmt_paise(paise: int) -> str:
+    """Formats integer paise as a Rupee string; cached since listings repeat amounts."""
+    rupees, rem = divmod(abs(paise), 100)
+    sign: str = '-' if paise < 0 else ''
+    return f'{RUPEE}{sign}{rupees:,}.{rem:02d}'
+
+@dataclass(slots=True)
 class Expense:
     date: date
     category: str
-    amount: Decimal
+    amount: int  # in paise
     description: str
+    month_key: str = field(init=False, repr=False, compare=False)
+    category_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.month_key = sys.intern(f"{self.date.year:04d}-{self.date.month:02d}")
+        self.category_lc = sys.intern(self.category.lower())
 
     @staticmethod
     def from_row(row: Dict[str, str]) -> "Expense":
         if not row:
             raise ValueError("Input row cannot be empty")
+        return Expense.from_fields(row.get("date"), row.get("category"), row.get("amount"), row.get("description"))
+
+    @staticmethod
+    def from_fields(date_str: Optional[str], category: Optional[str], amt_str: Optional[str], desc: Optional[str]) -> "Expense":
+        """
+        Builds an Expense from raw CSV field values, in EXPENSE_FIELDS order.
 
+        Raises:
+            ValueError: If any field is missing or invalid.
+        """
         try:
-            date_str = row.get("date")
             if not date_str:
                 raise ValueError("Missing date")
-            d = datetime.strptime(date_str.strip(), "%Y-%m-%d").date()
+            d = _parse_iso_date(date_str)
         except (KeyError, Exception) as e:
             raise ValueError("Invalid date format") from e
 
-        category = row.get("category")
         if not category:
             raise ValueError("Missing category")
-        category = category.strip()
+        category = sys.intern(category.strip())
 
-        desc = row.get("description")
         if not desc:
             raise ValueError("Missing description")
         desc = desc.strip()
 
         try:
-            amt_str = row.get("amount")
             if not amt_str:
                 raise ValueError("Missing amount")
-            amt = Decimal(str(amt_str).strip())
-        except (InvalidOperation, AttributeError, KeyError) as e:
+            amt = _to_paise(amt_str)
+        except (DecimalException, AttributeError, KeyError) as e:
             raise ValueError("Invalid amount") from e
 
         if amt <= 0:
@@ -60,12 +118,16 @@ class Expense:
         Returns:
             Dict[str, str]: A dictionary containing the date, category, amount, and description of the expense.
         """
-        return {
-            "date": self.date.strftime("%Y-%m-%d"),
-            "category": self.category,
-            'amount': format(self.amount, 'f'),
-            "description": self.description,
-        }
+        return dict(zip(EXPENSE_FIELDS, self.to_fields()))
+
+    def to_fields(self) -> Tuple[str, str, str, str]:
+        """
+        Converts the Expense object to a tuple of CSV field values, in EXPENSE_FIELDS order.
+
+        Returns:
+            Tuple[str, str, str, str]: The date, category, amount, and description of the expense.
+        """
+        return (self.date.isoformat(), self.category, format(_from_paise(self.amount), 'f'), self.description)
 
 class ExpenseTracker:
     def __init__(self, expenses_path: str = "personal_expense_tracker/data/expenses.csv", budget_path: str = "personal_expense_tracker/data/budget.json") -> None:
@@ -82,7 +144,14 @@ class ExpenseTracker:
         self.expenses_path: str = expenses_path
         self.budget_path: str = budget_path
         self.expenses: list[Expense] = []
-        self.budgets: dict[str, Decimal] = {}
+        self.budgets: dict[str, int] = {}
+        self._by_month: defaultdict[str, list[Expense]] = defaultdict(list)
+        self._by_category: defaultdict[str, list[Expense]] = defaultdict(list)
+        self._month_totals: defaultdict[str, int] = defaultdict(int)
+        self._grand_total: int = 0
+        # Leading expenses already on disk, and whether the CSV can take appended rows.
+        self._saved_count: int = 0
+        self._appendable: bool = False
         self.default_categories: list[str] = [
             "Food", "Travel", "Groceries", "Rent", "Utilities", "Bills", "Healthcare",
             "Education", "Entertainment", "Shopping", "Personal Care", "Miscellaneous",
@@ -125,33 +194,99 @@ class ExpenseTracker:
         """
         if not os.path.exists(self.expenses_path):
             return 0
-        count: int = 0
+        # A malformed file (e.g. an unterminated quote) is re-read leniently and never appended to.
+        try:
+            header, parsed = self._read_records(strict=True)
+            well_formed: bool = True
+        except csv.Error:
+            header, parsed = self._read_records(strict=False)
+            well_formed = False
+        if not header:
+            return 0
+        loaded: list[Expense] = [exp for exp in parsed if exp is not None]
+        # Expenses added before loading were never written, so they force a full rewrite.
+        unsaved: int = len(self.expenses) - self._saved_count
+        self.expenses.extend(loaded)
+        for exp in loaded:
+            self._index(exp)
+        self._saved_count = len(self.expenses)
+        self._appendable = (
+            well_formed and unsaved == 0 and len(loaded) == len(parsed) and tuple(header) == EXPENSE_FIELDS
+        )
+        return len(loaded)
+
+    def _read_records(self, strict: bool) -> Tuple[list[str], list[Optional[Expense]]]:
+        """
+        Reads the expenses CSV and parses every record after the header.
+
+        Args:
+            strict (bool): Whether the csv reader should reject malformed CSV.
+
+        Returns:
+            Tuple[list[str], list[Optional[Expense]]]: The header, empty if missing or lacking a
+            required column, and one entry per record, None where the record is invalid.
+
+        Raises:
+            csv.Error: If strict is set and the file is not well-formed CSV.
+        """
         with open(self.expenses_path, newline="", encoding="utf-8") as f:
-            reader: csv.DictReader[str] = csv.DictReader(f)
-            for row in reader:
-                try:
-                    exp: Expense = Expense.from_row(row)
-                    self.expenses.append(exp)
-                    count += 1
-                except ValueError:
-                    continue
-        return count
+            reader = csv.reader(f, strict=strict)
+            header: Optional[list[str]] = next(reader, None)
+            if not header:
+                return [], []
+            try:
+                pick: Callable[[list[str]], Tuple[str, ...]] = itemgetter(*(header.index(name) for name in EXPENSE_FIELDS))
+            except ValueError:
+                return [], []
+            return header, [self._parse_record(pick, rec) for rec in reader]
+
+    @staticmethod
+    def _parse_record(pick: Callable[[list[str]], Tuple[str, ...]], rec: list[str]) -> Optional[Expense]:
+        """
+        Builds an Expense from a raw CSV record.
+
+        Args:
+            pick (Callable): Selects the EXPENSE_FIELDS columns from the record.
+            rec (list[str]): The CSV record.
+
+        Returns:
+            Optional[Expense]: The parsed expense, or None if the record is short or invalid.
+        """
+        try:
+            return Expense.from_fields(*pick(rec))
+        except (ValueError, IndexError):
+            return None
 
     def _save_expenses(self) -> None:
         """Saves the expenses to a CSV file.
 
+        Expenses added since the last load or save are appended to the file; it is
+        only rewritten in full when it is missing, empty, malformed, has a foreign header or
+        rows that failed to load, or when expenses were added before loading.
+
         Args:
             None
 
         Returns:
             None
         """
-        with open(self.expenses_path, "w", newline="", encoding="utf-8") as f:
-            fieldnames: list[str] = ["date", "category", "amount", "description"]
-            writer: csv.DictWriter[str] = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for exp in self.expenses:
-                writer.writerow(exp.to_row())
+        pending: list[Expense] = self.expenses[self._saved_count:]
+        if self._appendable and os.path.exists(self.expenses_path) and os.path.getsize(self.expenses_path) > 0:
+            if pending:
+                with open(self.expenses_path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    needs_newline: bool = f.read(1) not in b"\r\n"
+                with open(self.expenses_path, "a", newline="", encoding="utf-8") as f:
+                    if needs_newline:
+                        f.write("\r\n")
+                    csv.writer(f).writerows(exp.to_fields() for exp in pending)
+        else:
+            with open(self.expenses_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(EXPENSE_FIELDS)
+                writer.writerows(exp.to_fields() for exp in self.expenses)
+            self._appendable = True
+        self._saved_count = len(self.expenses)
 
     def _load_budgets(self) -> int:
         """
@@ -164,11 +299,11 @@ class ExpenseTracker:
             return 0
         try:
             with open(self.budget_path, "r", encoding="utf-8") as f:
-                raw: Dict[str, Union[int, float]] = json.load(f)
-            self.budgets: Dict[str, Decimal] = {k: Decimal(str(v)) for k, v in raw.items()}
+                raw: Dict[str, Union[str, Decimal]] = json.load(f, parse_float=Decimal, parse_int=Decimal)
+            self.budgets = {k: _to_paise(v) for k, v in raw.items()}
             return len(self.budgets)
-        except Exception as e:
-            self.budgets: Dict[str, Decimal] = {}
+        except Exception:
+            self.budgets = {}
             return 0
 
     def _save_budgets(self) -> None:
@@ -181,36 +316,39 @@ class ExpenseTracker:
             None
         """
         with open(self.budget_path, "w", encoding="utf-8") as f:
-            json.dump({k: format(v, 'f') for k, v in self.budgets.items()}, f, indent=2)
+            f.write(json.dumps({k: format(_from_paise(v), 'f') for k, v in self.budgets.items()}, indent=2))
 
-    @staticmethod
-    def _month_key(d: datetime.date) -> str:
+    def _index(self, exp: Expense) -> None:
         """
-        Converts a date to a month key string.
+        Registers an expense in the month and category lookups and the running totals.
 
         Args:
-            d (datetime.date): The date to be converted.
+            exp (Expense): The expense to be indexed.
 
         Returns:
-            str: The month key in the format "YYYY-MM".
+            None
         """
-        return d.strftime("%Y-%m")
+        self._by_month[exp.month_key].append(exp)
+        self._by_category[exp.category_lc].append(exp)
+        self._month_totals[exp.month_key] += exp.amount
+        self._grand_total += exp.amount
 
-    def add_expense(self, d: date, category: str, amount: Decimal, description: str) -> Expense:
+    def add_expense(self, d: date, category: str, amount: int, description: str) -> Expense:
         """
         Adds a new expense to the list.
 
         Args:
             d (date): The date of the expense.
             category (str): The category of the expense.
-            amount (Decimal): The amount of the expense.
+            amount (int): The amount of the expense, in paise.
             description (str): The description of the expense.
 
         Returns:
             Expense: The newly added expense.
         """
-        exp = Expense(date=d, category=category.strip(), amount=amount, description=description.strip())
+        exp = Expense(date=d, category=sys.intern(category.strip()), amount=amount, description=description.strip())
         self.expenses.append(exp)
+        self._index(exp)
         return exp
 
     def list_expenses(self, month_key: str | None = None, category: str | None = None) -> list[Expense]:
@@ -224,34 +362,45 @@ class ExpenseTracker:
         Returns:
             list[Expense]: A list of expenses that match the specified filters.
         """
-        items = self.expenses
         if month_key:
-            items = [e for e in items if self._month_key(e.date) == month_key]
-        if category:
-            items = [e for e in items if e.category.lower() == category.lower()]
-        return items
+            month_key = sys.intern(month_key)
+        cat_lc: str = sys.intern(category.lower()) if category else ''
+        if month_key and cat_lc:
+            by_month: list[Expense] = self._by_month.get(month_key, [])
+            by_category: list[Expense] = self._by_category.get(cat_lc, [])
+            if len(by_month) <= len(by_category):
+                return [e for e in by_month if e.category_lc == cat_lc]
+            return [e for e in by_category if e.month_key == month_key]
+        if month_key:
+            return list(self._by_month.get(month_key, ()))
+        if cat_lc:
+            return list(self._by_category.get(cat_lc, ()))
+        return list(self.expenses)
 
-    def total_expenses(self, month_key: str | None = None) -> Decimal:
+    def total_expenses(self, month_key: str | None = None, items: Iterable[Expense] | None = None) -> int:
         """
         Retrieves the total expenses for a given month or for all months.
 
         Args:
             month_key (str | None): The key representing the month (YYYY-MM), or None for all months.
+            items (Iterable[Expense] | None): Already filtered expenses to total instead, e.g. from list_expenses.
 
         Returns:
-            Decimal: The total expenses for the specified month or for all months.
+            int: The total expenses in paise for the given items, the specified month or all months.
         """
-        items: List[Expense] = self.list_expenses(month_key=month_key)
-        total: Decimal = sum((e.amount for e in items), Decimal('0'))
-        return total
+        if items is not None:
+            return sum(e.amount for e in items)
+        if month_key:
+            return self._month_totals.get(month_key, 0)
+        return self._grand_total
 
-    def set_budget(self, month_key: str, amount: Decimal) -> None:
+    def set_budget(self, month_key: str, amount: int) -> None:
         """
         Sets the budget for a given month.
 
         Args:
             month_key (str): The key representing the month (YYYY-MM).
-            amount (Decimal): The budget amount.
+            amount (int): The budget amount, in paise.
 
         Returns:
             None
@@ -263,7 +412,7 @@ class ExpenseTracker:
             raise ValueError("Budget must be positive")
         self.budgets[month_key] = amount
 
-    def get_budget(self, month_key: str) -> Optional[Decimal]:
+    def get_budget(self, month_key: str) -> Optional[int]:
         """
         Retrieves the budget amount for a given month.
 
@@ -271,11 +420,11 @@ class ExpenseTracker:
             month_key (str): The key representing the month (YYYY-MM).
 
         Returns:
-            Optional[Decimal]: The budget amount for the specified month, or None if no budget is set.
+            Optional[int]: The budget amount in paise for the specified month, or None if no budget is set.
         """
         return self.budgets.get(month_key)
 
-    def budget_status(self, month_key: str) -> Dict[str, Decimal]:
+    def budget_status(self, month_key: str) -> Dict[str, Union[str, Decimal]]:
         """
         Retrieves the budget status for a given month.
 
@@ -283,11 +432,11 @@ class ExpenseTracker:
             month_key (str): The key representing the month (YYYY-MM).
 
         Returns:
-            Dict[str, Decimal]: A dictionary containing the budget status information.
+            Dict[str, Union[str, Decimal]]: A dictionary containing the budget status information, with amounts in rupees.
         """
-        total = self.total_expenses(month_key)
-        budget = self.get_budget(month_key)
-        if budget is None:
+        total: Decimal = _from_paise(self._month_totals.get(month_key, 0))
+        budget_paise: Optional[int] = self.get_budget(month_key)
+        if budget_paise is None:
             return {
                 "month": month_key,
                 "budget": Decimal('nan'),  # Not a number
@@ -295,8 +444,9 @@ class ExpenseTracker:
                 "remaining": Decimal('nan'),  # Not a number
                 "status": "no_budget",
             }
-        remaining = budget - total
-        status = "within_budget" if remaining >= 0 else "exceeded_budget"
+        budget: Decimal = _from_paise(budget_paise)
+        remaining: Decimal = budget - total
+        status: str = "within_budget" if remaining >= 0 else "exceeded_budget"
         return {
             "month": month_key,
             "budget": budget,
@@ -306,7 +456,7 @@ class ExpenseTracker:
         }
 
     @staticmethod
-    def parse_date(value: str) -> datetime.date:
+    def parse_date(value: str) -> date:
         """
         Converts a string to a date object.
 
@@ -314,38 +464,40 @@ class ExpenseTracker:
             value (str): The date string to be parsed, in the format YYYY-MM-DD.
 
         Returns:
-            datetime.date: The parsed date object.
+            date: The parsed date object.
         """
-        return datetime.strptime(value.strip(), "%Y-%m-%d").date()
+        return _parse_iso_date(value)
 
     @staticmethod
-    def parse_amount(value: str) -> Decimal:
+    def parse_amount(value: str) -> int:
         """
-        Converts a string to a Decimal amount.
+        Converts a rupee string to an amount in paise.
 
         Args:
             value (str): The amount to be parsed.
 
         Returns:
-            Decimal: The parsed amount.
+            int: The parsed amount, in paise.
 
         Raises:
             ValueError: If the amount is not positive.
         """
-        amt: Decimal = Decimal(str(value).strip())
+        amt: int = _to_paise(value)
         if amt <= 0:
             raise ValueError("Amount must be positive")
         return amt
 
     @staticmethod
-    def fmt_money(value: Decimal) -> str:
+    def fmt_money(value: Union[int, Decimal]) -> str:
         """
-        Formats a Decimal value as a string representing money.
+        Formats an amount as a string representing money.
 
         Args:
-            value (Decimal): The amount to be formatted.
+            value (int | Decimal): The amount to be formatted, as int paise or as a Decimal in rupees.
 
         Returns:
             str: A string representation of the amount, prefixed with the Rupee symbol and formatted to two decimal places.
         """
+        if isinstance(value, int):
+            return _fmt_paise(value)
         return f'{RUPEE}{format(value, ",.2f")}'
@@ -2,6 +2,7 @@
 from datetime import date
 from decimal import Decimal
 from typing import Optional
+import re
 import sys
 
 from expense_tracker import ExpenseTracker
@@ -21,6 +22,8 @@ What would you like to do?
   5) Exit
 Choose an option (1-5): """
 
+_MONTH_RE = re.compile(r'(\d{4})-(\d{2})', re.ASCII)
+
 def prompt(input_text: str) -> str:
     """
     Prompts the user for input and handles potential exceptions.
@@ -61,17 +64,13 @@ def choose_month(default_month: str | None = None) -> str:
         str: The chosen month in the format YYYY-MM.
     """
     if default_month is None:
-        from datetime import date
         default_month = date.today().strftime("%Y-%m")
-    val = prompt(f"Enter month (YYYY-MM) [{default_month}]: ") or default_month
-    try:
-        year, mon = val.split("-")
-        assert len(year) == 4 and len(mon) == 2
-        int(year); int(mon)
-    except Exception:
+    while True:
+        val = prompt(f"Enter month (YYYY-MM) [{default_month}]: ") or default_month
+        m = _MONTH_RE.fullmatch(val)
+        if m and 1 <= int(m.group(2)) <= 12:
+            return val
         print("Invalid month format. Please use YYYY-MM (e.g., 2025-01).")
-        return choose_month(default_month)
-    return val
 
 def add_expense_flow(tracker: ExpenseTracker) -> None:
     """
@@ -102,7 +101,7 @@ def add_expense_flow(tracker: ExpenseTracker) -> None:
     while True:
         amount_input: str = prompt("  Amount (numbers only): ")
         try:
-            expense_amount: Decimal = tracker.parse_amount(amount_input)
+            expense_amount: int = tracker.parse_amount(amount_input)
             break
         except Exception as error:
             print(f"  {error}. Try again.")
@@ -147,7 +146,7 @@ def view_expenses_flow(tracker: ExpenseTracker) -> None:
         amt: str = tracker.fmt_money(e.amount)
         desc: str = (e.description[:28] + '...') if len(e.description) > 30 else e.description
         print(f"  {i:2} {e.date}  {e.category:14} {amt:13} {desc}")
-    total: Decimal = tracker.total_expenses(month_key=month)
+    total: int = tracker.total_expenses(items=items)
     scope: str = f"month {month}" if month else (f"category '{category}'" if category else "all")
     print(f"\n  Total for {scope}: {tracker.fmt_money(total)}")
 
@@ -168,7 +167,7 @@ def track_budget_flow(tracker: ExpenseTracker) -> None:
         while True:
             amt_str: str = prompt("  Enter monthly budget amount: ")
             try:
-                amt: Decimal = tracker.parse_amount(amt_str)
+                amt: int = tracker.parse_amount(amt_str)
                 tracker.set_budget(month, amt)
                 print(f"  Budget for {month} set to {tracker.fmt_money(amt)}")
                 break